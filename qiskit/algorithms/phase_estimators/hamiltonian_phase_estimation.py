@@ -0,0 +1,591 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Phase estimation for the spectrum of a Hamiltonian"""
+
+from typing import List, Optional, Sequence, Union
+from collections import OrderedDict
+from concurrent import futures
+import threading
+import numpy
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit.utils import QuantumInstance
+from qiskit.opflow import (EvolutionBase, PauliTrotterEvolution, SummedOp, PauliOp,
+                           MatrixOp, PauliSumOp, StateFn)
+from qiskit.providers import BaseBackend, Backend
+from qiskit.quantum_info import PauliTable, SparsePauliOp
+from .phase_estimation import PhaseEstimation
+from .hamiltonian_phase_estimation_result import HamiltonianPhaseEstimationResult
+from .phase_estimation_result import PhaseEstimationResult
+from .phase_estimation_scale import PhaseEstimationScale
+
+
+class HamiltonianPhaseEstimation:
+    r"""Run the Quantum Phase Estimation algorithm to find the eigenvalues of a Hermitian operator.
+
+    This class is nearly the same as :class:`~qiskit.algorithms.PhaseEstimation`, differing only
+    in that the input in that class is a unitary operator, whereas here the input is a Hermitian
+    operator from which a unitary will be obtained by scaling and exponentiating. The scaling is
+    performed in order to prevent the phases from wrapping around :math:`2\pi`.
+    The problem of estimating eigenvalues :math:`\lambda_j` of the Hermitian operator
+    :math:`H` is solved by running a circuit representing
+
+    .. math::
+
+        \exp(i b H) |\psi\rangle = \sum_j \exp(i b \lambda_j) c_j |\lambda_j\rangle,
+
+    where the input state is
+
+    .. math::
+
+        |\psi\rangle = \sum_j c_j |\lambda_j\rangle,
+
+    and :math:`\lambda_j` are the eigenvalues of :math:`H`.
+
+    Here, :math:`b` is a scaling factor sufficiently large to map positive :math:`\lambda` to
+    :math:`[0,\pi)` and negative :math:`\lambda` to :math:`[\pi,2\pi)`. Each time the circuit is
+    run, one measures a phase corresponding to :math:`\lambda_j` with probability :math:`|c_j|^2`.
+
+    If :math:`H` is a Pauli sum, the bound :math:`b` is computed from the sum of the absolute
+    values of the coefficients of the terms. There is no way to reliably recover eigenvalues
+    from phases very near the endpoints of these intervals. Because of this you should be aware
+    that for degenerate cases, such as :math:`H=Z`, the eigenvalues :math:`\pm 1` will be
+    mapped to the same phase, :math:`\pi`, and so cannot be distinguished. In this case, you need
+    to specify a larger bound as an argument to the method ``estimate``.
+
+    This class uses and works together with :class:`~qiskit.algorithms.PhaseEstimationScale` to
+    manage scaling the Hamiltonian and the phases that are obtained by the QPE algorithm. This
+    includes setting, or computing, a bound on the eigenvalues of the operator, using this
+    bound to obtain a scale factor, scaling the operator, and shifting and scaling the measured
+    phases to recover the eigenvalues.
+
+    Note that, although we speak of "evolving" the state according the the Hamiltonian, in the
+    present algorithm, we are not actually considering time evolution. Rather, the role of time is
+    played by the scaling factor, which is chosen to best extract the eigenvalues of the
+    Hamiltonian.
+
+    A few of the ideas in the algorithm may be found in Ref. [1].
+
+    **Reference:**
+
+    [1]: Quantum phase estimation of multiple eigenvalues for small-scale (noisy) experiments
+         T.E. O'Brien, B. Tarasinski, B.M. Terhal
+         `arXiv:1809.09697 <https://arxiv.org/abs/1809.09697>`_
+    """
+
+    # Maximum number of entries retained in the unitary cache.
+    _CACHE_MAXSIZE = 128
+
+    # Maximum number of phase estimation results retained. Results hold a
+    # reference to the backend result, so this cache is kept small.
+    _PE_CACHE_SIZE = 16
+
+    def __init__(self,
+                 num_evaluation_qubits: int,
+                 quantum_instance: Optional[Union[QuantumInstance,
+                                                  BaseBackend, Backend]] = None) -> None:
+        """
+        Args:
+            num_evaluation_qubits: The number of qubits used in estimating the phase. The phase will
+                be estimated as a binary string with this many bits.
+            quantum_instance: The quantum instance on which the circuit will be run.
+        """
+        self._phase_estimation = PhaseEstimation(
+            num_evaluation_qubits=num_evaluation_qubits,
+            quantum_instance=quantum_instance)
+        # Evolved unitary circuits, keyed by the content of the Hamiltonian
+        # they were derived from. Synthesizing the evolution dominates the
+        # classical cost of ``estimate``, and outer loops (state sweeps,
+        # repeated estimates of the same operator) hit the same Hamiltonian
+        # over and over.
+        self._unitary_cache = OrderedDict()
+        # Full phase estimation results, keyed by the OpenQASM serialization
+        # of the unitary and state-preparation circuits. The backend call is
+        # by far the dominant cost, so repeating an estimate with unchanged
+        # circuits returns the previous result without re-executing.
+        self._pe_cache = OrderedDict()
+        # Converted state-preparation circuits keyed by the identity of the
+        # StateFn. The StateFn is kept in the value so that its id cannot be
+        # recycled while the entry is alive.
+        self._state_prep_cache = OrderedDict()
+        # Guards the caches so that ``estimate_many`` may run estimates from
+        # worker threads.
+        self._lock = threading.RLock()
+
+    def _get_unitary(self, hamiltonian, pe_scale, evolution) -> QuantumCircuit:
+        """Evolve the Hamiltonian to obtain a unitary.
+
+        Apply the scaling to the Hamiltonian that has been computed from an eigenvalue bound
+        and compute the unitary by applying the evolution object. On the Trotter path the
+        scale enters the evolution as a circuit :class:`~qiskit.circuit.Parameter`, so the
+        synthesized template is cached keyed only on the Hamiltonian content and the
+        evolution; a new scale (for instance from a bound sweep) costs one parameter
+        binding instead of a fresh synthesis.
+
+        Returns:
+            A unitary circuit.
+        """
+        ham_key = _hamiltonian_key(hamiltonian)
+        if ham_key is not None and isinstance(evolution, PauliTrotterEvolution):
+            trotter = evolution.trotter
+            cache_key = (ham_key, type(trotter).__name__,
+                         getattr(trotter, 'order', None), getattr(trotter, 'reps', None))
+            with self._lock:
+                cached = self._unitary_cache.get(cache_key)
+                if cached is not None:
+                    self._unitary_cache.move_to_end(cache_key)
+            if cached is not None:
+                template_circuit, scale_parameter = cached
+            else:
+                # Grouping commuting terms shortens the Trotter circuit, which
+                # reduces the cost of decomposition and of running the circuit.
+                hamiltonian = _reorder_paulis(hamiltonian)
+                scale_parameter = Parameter('s')
+                if getattr(trotter, 'order', None) == 1:
+                    # First-order Trotterization of a Pauli sum has a known
+                    # circuit; emitting it directly skips the operator-flow
+                    # conversion stack and the decompose pass entirely.
+                    template_circuit = _trotter_evolution_circuit(
+                        hamiltonian, scale_parameter, trotter.reps)
+                else:
+                    templated = evolution.convert((-scale_parameter * hamiltonian).exp_i())
+                    if not isinstance(templated, QuantumCircuit):
+                        template_circuit = templated.to_circuit()
+                    else:
+                        template_circuit = templated
+                    template_circuit = template_circuit.decompose()
+                with self._lock:
+                    self._unitary_cache[cache_key] = (template_circuit, scale_parameter)
+                    if len(self._unitary_cache) > self._CACHE_MAXSIZE:
+                        self._unitary_cache.popitem(last=False)
+            # binding returns a new circuit, so the cached template is untouched.
+            return template_circuit.assign_parameters({scale_parameter: float(pe_scale.scale)})
+
+        # Grouping commuting terms shortens the Trotter circuit, which reduces
+        # the cost of decomposition and of running the circuit.
+        if isinstance(evolution, PauliTrotterEvolution) and isinstance(hamiltonian, SummedOp):
+            hamiltonian = _reorder_paulis(hamiltonian)
+
+        # scale so that phase does not wrap. The scale is cast to a Python
+        # float: a numpy scalar on the left of ``*`` would be broadcast over
+        # the operator instead of deferring to the operator's ``__rmul__``.
+        scaled_hamiltonian = -float(pe_scale.scale) * hamiltonian
+        unitary = evolution.convert(scaled_hamiltonian.exp_i())
+        if not isinstance(unitary, QuantumCircuit):
+            unitary_circuit = unitary.to_circuit()
+        else:
+            unitary_circuit = unitary
+
+        # When the backend advertises a basis gate set, a single targeted
+        # transpilation to that set replaces the recursive decompose passes
+        # and does not expand the circuit deeper than the backend needs.
+        basis_gates = self._backend_basis_gates()
+        if basis_gates:
+            return transpile(unitary_circuit, basis_gates=basis_gates, optimization_level=1)
+
+        unitary_circuit = unitary_circuit.decompose()
+        # Decomposing twice allows some 1Q Hamiltonians to give correct results
+        # when using MatrixEvolution(), that otherwise would give incorrect results.
+        # Restricting the second pass to that case spares multi-qubit Trotter
+        # circuits a full extra DAG traversal and rebuild.
+        from qiskit.opflow import MatrixEvolution
+        if hamiltonian.num_qubits == 1 and isinstance(evolution, MatrixEvolution):
+            unitary_circuit = unitary_circuit.decompose()
+        return unitary_circuit
+
+    def _backend_basis_gates(self) -> Optional[List[str]]:
+        """Return the basis gates of the backend this estimator will run on, or
+        ``None`` if no backend is set or it does not report a basis."""
+        quantum_instance = self._phase_estimation._quantum_instance
+        if quantum_instance is None:
+            return None
+        basis_gates = getattr(quantum_instance.backend.configuration(), 'basis_gates', None)
+        if basis_gates is None:
+            return None
+        # Raw unitary/hamiltonian gates are left opaque, which retriggers the
+        # 1Q MatrixEvolution bug that the decompose passes work around; drop
+        # them from the target so they are synthesized to elementary gates.
+        return [gate for gate in basis_gates if gate not in ('unitary', 'hamiltonian')]
+
+    def _state_prep_circuit(self, state_preparation) -> QuantumCircuit:
+        """Convert ``state_preparation`` to a circuit, reusing a previous conversion
+        when the same ``StateFn`` is passed again."""
+        key = id(state_preparation)
+        with self._lock:
+            entry = self._state_prep_cache.get(key)
+            if entry is not None:
+                self._state_prep_cache.move_to_end(key)
+                return entry[1]
+        circuit = state_preparation.to_circuit_op().to_circuit()
+        with self._lock:
+            self._state_prep_cache[key] = (state_preparation, circuit)
+            if len(self._state_prep_cache) > self._CACHE_MAXSIZE:
+                self._state_prep_cache.popitem(last=False)
+        return circuit
+
+    # pylint: disable=arguments-differ
+    def estimate(self, hamiltonian: Union[SummedOp, PauliOp, MatrixOp, PauliSumOp],
+                 state_preparation: Optional[StateFn] = None,
+                 evolution: Optional[EvolutionBase] = None,
+                 bound: Optional[float] = None) -> HamiltonianPhaseEstimationResult:
+        """Run the Hamiltonian phase estimation algorithm.
+
+        Args:
+            hamiltonian: A Hermitian operator.
+            state_preparation: The ``StateFn`` to be prepared, whose eigenphase will be
+                measured. If this parameter is omitted, no preparation circuit will be run and
+                input state will be the all-zero state in the computational basis.
+            evolution: An evolution converter that generates a unitary from ``hamiltonian``. If
+                ``None``, then the default ``PauliTrotterEvolution`` is used.
+            bound: An upper bound on the absolute value of the eigenvalues of
+                ``hamiltonian``. If omitted, then ``hamiltonian`` must be a Pauli sum, or a
+                ``PauliOp``, in which case a bound will be computed. If ``hamiltonian``
+                is a ``MatrixOp``, then ``bound`` may not be ``None``. The tighter the bound,
+                the higher the resolution of computed phases.
+
+        Returns:
+            HamiltonianPhaseEstimationResult instance containing the result of the estimation
+            and diagnostic information.
+
+        Raises:
+            ValueError: If ``bound`` is ``None`` and ``hamiltonian`` is not a Pauli sum, i.e. a
+                ``PauliSumOp`` or a ``SummedOp`` whose terms are of type ``PauliOp``.
+            TypeError: If ``evolution`` is not of type ``EvolutionBase``.
+        """
+        if evolution is None:
+            evolution = PauliTrotterEvolution()
+        elif not isinstance(evolution, EvolutionBase):
+            raise TypeError('Expecting type EvolutionBase, got {}'.format(type(evolution)))
+
+        if isinstance(hamiltonian, PauliOp):
+            hamiltonian = SummedOp([hamiltonian])
+
+        # A PauliSumOp is processed as is: its SparsePauliOp primitive already
+        # holds the symplectic data contiguously, so expanding it into one
+        # PauliOp per term would only add Python-object overhead.
+        if isinstance(hamiltonian, (SummedOp, PauliSumOp)):
+            # remove identitiy terms
+            # The term proportional to the identity is removed from hamiltonian.
+            # This is done for three reasons:
+            # 1. Work around an unknown bug that otherwise causes the energies to be wrong in
+            #    some cases.
+            # 2. Allow working with a simpler Hamiltonian, one with fewer terms.
+            # 3. Tighten the bound on the eigenvalues so that the spectrum is better resolved,
+            #    i.e. allow using smaller numbers of qubits.
+            # The sum of |coeff| over the kept terms is computed in the same
+            # pass, so the auto-bound case needs no second scan of the terms.
+            id_coefficient, hamiltonian_no_id, sum_abs_coeff = _remove_identity(hamiltonian)
+
+            if isinstance(hamiltonian_no_id, SummedOp) and not hamiltonian_no_id.oplist:
+                # A pure-identity Hamiltonian has the single eigenvalue
+                # id_coefficient, so answer directly rather than evolving an
+                # empty operator and running the backend.
+                num_evaluation_qubits = self._phase_estimation._num_evaluation_qubits
+                phases = numpy.zeros(2 ** num_evaluation_qubits)
+                phases[0] = 1.0
+                return HamiltonianPhaseEstimationResult(
+                    phase_estimation_result=PhaseEstimationResult(
+                        num_evaluation_qubits, circuit_result=None, phases=phases),
+                    phase_estimation_scale=PhaseEstimationScale(1.0),
+                    id_coefficient=id_coefficient)
+
+            # get the rescaling object
+            if bound is not None:
+                pe_scale = PhaseEstimationScale(bound)
+            elif sum_abs_coeff is not None:
+                pe_scale = PhaseEstimationScale(sum_abs_coeff)
+            else:
+                # Symbolic coefficients defeated the fused bound computation.
+                pe_scale = PhaseEstimationScale.from_pauli_sum(hamiltonian_no_id)
+
+            # get the unitary
+            unitary = self._get_unitary(hamiltonian_no_id, pe_scale, evolution)
+
+        elif isinstance(hamiltonian, MatrixOp):
+            if bound is None:
+                raise ValueError('bound must be specified if Hermitian operator is MatrixOp')
+
+            # Do not subtract an identity term from the matrix, so do not compensate.
+            id_coefficient = 0.0
+            pe_scale = PhaseEstimationScale(bound)
+            unitary = self._get_unitary(hamiltonian, pe_scale, evolution)
+        else:
+            raise TypeError('Hermitian operator of type {} not supported.'
+                            .format(type(hamiltonian)))
+
+        if state_preparation is not None:
+            state_preparation = self._state_prep_circuit(state_preparation)
+        # run phase estimation
+        pe_key = (unitary.qasm(),
+                  state_preparation.qasm() if state_preparation is not None else None)
+        with self._lock:
+            phase_estimation_result = self._pe_cache.get(pe_key)
+            if phase_estimation_result is not None:
+                self._pe_cache.move_to_end(pe_key)
+        if phase_estimation_result is None:
+            phase_estimation_result = self._phase_estimation.estimate(
+                unitary=unitary, state_preparation=state_preparation)
+            with self._lock:
+                self._pe_cache[pe_key] = phase_estimation_result
+                if len(self._pe_cache) > self._PE_CACHE_SIZE:
+                    self._pe_cache.popitem(last=False)
+
+        return HamiltonianPhaseEstimationResult(
+            phase_estimation_result=phase_estimation_result,
+            id_coefficient=id_coefficient,
+            phase_estimation_scale=pe_scale)
+
+    def estimate_many(self,
+                      hamiltonian: Union[SummedOp, PauliOp, MatrixOp, PauliSumOp],
+                      state_preparations: Optional[Sequence[Optional[StateFn]]] = None,
+                      evolution: Optional[EvolutionBase] = None,
+                      bounds: Optional[Sequence[Optional[float]]] = None,
+                      max_workers: Optional[int] = None
+                      ) -> List[HamiltonianPhaseEstimationResult]:
+        """Run several independent phase estimations of ``hamiltonian`` concurrently.
+
+        This is equivalent to calling :meth:`estimate` once per entry of
+        ``state_preparations`` and ``bounds``, except that the estimates run in a
+        thread pool. The circuit caches are shared across the batch, so the evolved
+        unitary for the Hamiltonian is synthesized once and each worker spends its
+        time in the backend call.
+
+        Args:
+            hamiltonian: A Hermitian operator, as for :meth:`estimate`.
+            state_preparations: A sequence of states whose eigenphases will be
+                measured, one estimate per entry. If omitted, a single all-zero
+                input state is paired with each entry of ``bounds``.
+            evolution: An evolution converter that generates a unitary from
+                ``hamiltonian``. If ``None``, then the default
+                ``PauliTrotterEvolution`` is used.
+            bounds: A sequence of eigenvalue bounds, one estimate per entry. If
+                omitted, the bound is computed (or taken as ``None``) for each
+                state. A length-one sequence is broadcast against
+                ``state_preparations`` and vice versa.
+            max_workers: The maximum number of worker threads. ``None`` uses the
+                ``concurrent.futures`` default.
+
+        Returns:
+            A list of ``HamiltonianPhaseEstimationResult``, in the order of the
+            input sequences.
+
+        Raises:
+            ValueError: If ``state_preparations`` and ``bounds`` have different
+                lengths and neither has length one.
+        """
+        state_preparations = list(state_preparations) if state_preparations is not None \
+            else [None]
+        bounds = list(bounds) if bounds is not None else [None]
+        if len(state_preparations) == 1 and len(bounds) > 1:
+            state_preparations = state_preparations * len(bounds)
+        elif len(bounds) == 1 and len(state_preparations) > 1:
+            bounds = bounds * len(state_preparations)
+        if len(state_preparations) != len(bounds):
+            raise ValueError('The numbers of state preparations ({}) and bounds ({}) are '
+                             'incompatible.'.format(len(state_preparations), len(bounds)))
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            jobs = [executor.submit(self.estimate, hamiltonian, state_preparation,
+                                    evolution, bound)
+                    for state_preparation, bound in zip(state_preparations, bounds)]
+            return [job.result() for job in jobs]
+
+
+def _hamiltonian_key(hamiltonian):
+    """Return a hashable key describing the content of ``hamiltonian``, or ``None`` if no
+    cheap content key is available.
+
+    A ``SummedOp`` of numerically-weighted Pauli terms is keyed by the symplectic arrays and
+    coefficient of every term; other operators are not keyed and so are not cached.
+    """
+    if isinstance(hamiltonian, PauliSumOp):
+        if not isinstance(hamiltonian.coeff, (int, float, complex)):
+            return None
+        primitive = hamiltonian.primitive
+        return (complex(hamiltonian.coeff), primitive.table.Z.tobytes(),
+                primitive.table.X.tobytes(), primitive.coeffs.tobytes())
+    if not isinstance(hamiltonian, SummedOp):
+        return None
+    if not isinstance(hamiltonian.coeff, (int, float, complex)):
+        return None
+    terms = []
+    for op in hamiltonian:
+        if not isinstance(op, PauliOp) or not isinstance(op.coeff, (int, float, complex)):
+            return None
+        primitive = op.primitive
+        terms.append((primitive.z.tobytes(), primitive.x.tobytes(), complex(op.coeff)))
+    return (complex(hamiltonian.coeff), tuple(terms))
+
+
+def _trotter_evolution_circuit(pauli_sum, scale, reps):
+    """Return a circuit implementing ``(-scale * pauli_sum).exp_i()`` by first-order
+    Trotterization.
+
+    Each Pauli exponential is appended as the standard basis-change, CX-ladder,
+    RZ pattern, working directly on the symplectic arrays of the terms. The
+    result matches what ``PauliTrotterEvolution`` produces, including the term
+    ordering, without the intermediate operator construction and traversal.
+    ``scale`` may be a :class:`~qiskit.circuit.Parameter`.
+    """
+    if isinstance(pauli_sum, PauliSumOp):
+        primitive = pauli_sum.primitive
+        z_rows = primitive.table.Z
+        x_rows = primitive.table.X
+        coeffs = primitive.coeffs * pauli_sum.coeff
+    else:
+        ops = list(pauli_sum)
+        z_rows = [op.primitive.z for op in ops]
+        x_rows = [op.primitive.x for op in ops]
+        coeffs = [op.coeff * pauli_sum.coeff for op in ops]
+    circuit = QuantumCircuit(pauli_sum.num_qubits)
+    for _ in range(reps):
+        for i in reversed(range(len(coeffs))):
+            z = z_rows[i]
+            x = x_rows[i]
+            coeff = coeffs[i]
+            if isinstance(coeff, complex) and coeff.imag == 0:
+                coeff = coeff.real
+            theta = -scale * coeff / reps
+            qubits = [int(q) for q in numpy.flatnonzero(z | x)]
+            for qubit in qubits:
+                if x[qubit]:
+                    if z[qubit]:
+                        circuit.sdg(qubit)
+                    circuit.h(qubit)
+            for control, target in zip(qubits[:-1], qubits[1:]):
+                circuit.cx(control, target)
+            circuit.rz(2 * theta, qubits[-1])
+            for control, target in zip(qubits[-2::-1], qubits[:0:-1]):
+                circuit.cx(control, target)
+            for qubit in qubits:
+                if x[qubit]:
+                    circuit.h(qubit)
+                    if z[qubit]:
+                        circuit.s(qubit)
+    return circuit
+
+
+def _reorder_paulis(summed_op):
+    """Reorder the terms of ``summed_op`` so that mutually commuting terms are adjacent.
+
+    The terms are grouped by a greedy largest-degree-first coloring of the
+    anticommutation graph, computed from the symplectic representation of the
+    Pauli terms. Adjacent commuting exponentials merge more readily during
+    Trotterization, which shortens the evolved circuit.
+    """
+    if isinstance(summed_op, PauliSumOp):
+        primitive = summed_op.primitive
+        z_stack = primitive.table.Z.astype(numpy.uint8)
+        x_stack = primitive.table.X.astype(numpy.uint8)
+    else:
+        ops = list(summed_op)
+        if len(ops) <= 1:
+            return summed_op
+        z_stack = numpy.stack([op.primitive.z for op in ops]).astype(numpy.uint8)
+        x_stack = numpy.stack([op.primitive.x for op in ops]).astype(numpy.uint8)
+    num_terms = z_stack.shape[0]
+    if num_terms <= 1:
+        return summed_op
+    # Two Paulis anticommute iff their symplectic inner product is odd.
+    anticommute = (z_stack @ x_stack.T + x_stack @ z_stack.T) % 2
+    numpy.fill_diagonal(anticommute, 0)
+    degrees = anticommute.sum(axis=1)
+    colors = {}
+    for i in numpy.argsort(-degrees, kind='stable'):
+        neighbor_colors = {colors[j] for j in numpy.flatnonzero(anticommute[i]) if j in colors}
+        color = 0
+        while color in neighbor_colors:
+            color += 1
+        colors[i] = color
+    order = sorted(range(num_terms), key=lambda i: (colors[i], i))
+    if order == list(range(num_terms)):
+        return summed_op
+    if isinstance(summed_op, PauliSumOp):
+        table = PauliTable(numpy.hstack([primitive.table.X[order], primitive.table.Z[order]]))
+        return PauliSumOp(SparsePauliOp(table, primitive.coeffs[order]),
+                          coeff=summed_op.coeff)
+    return SummedOp([ops[i] for i in order], coeff=summed_op.coeff)
+
+
+def _nontrivial_mask(z_stack, x_stack):
+    """Return a boolean mask selecting the non-identity rows of the stacked
+    symplectic arrays.
+
+    The vectors are packed into 64-bit words so that the identity test reduces
+    to comparing a handful of integers per term rather than scanning one byte
+    per qubit; for Hamiltonians on at most 64 qubits a term collapses to a
+    single word.
+    """
+    pad = -z_stack.shape[1] % 64
+    if pad:
+        z_stack = numpy.pad(z_stack, ((0, 0), (0, pad)))
+        x_stack = numpy.pad(x_stack, ((0, 0), (0, pad)))
+    z_words = numpy.packbits(z_stack, axis=1, bitorder='little').view(numpy.uint64)
+    x_words = numpy.packbits(x_stack, axis=1, bitorder='little').view(numpy.uint64)
+    return (z_words | x_words).any(axis=1)
+
+
+def _remove_identity(pauli_sum):
+    """Remove any identity operators from `pauli_sum`. Return the sum of the
+    coefficients of the identities, the new operator, and the sum of the absolute
+    values of the coefficients of the remaining terms, which serves as a bound
+    on the absolute values of the eigenvalues. The bound is ``None`` when the
+    coefficients are unbound parameters.
+    """
+    if isinstance(pauli_sum, PauliSumOp):
+        # The SparsePauliOp primitive already stores the symplectic data and
+        # coefficients contiguously; index it without expanding per-term ops.
+        primitive = pauli_sum.primitive
+        z_stack = primitive.table.Z
+        x_stack = primitive.table.X
+        coeffs = primitive.coeffs * complex(pauli_sum.coeff)
+    else:
+        ops = list(pauli_sum)
+        if not ops:
+            return 0.0, SummedOp([]), 0.0
+        try:
+            coeffs = numpy.fromiter((op.coeff for op in ops), dtype=complex, count=len(ops))
+        except TypeError:
+            # Unbound parameter coefficients cannot be vectorized, but the
+            # symplectic mask still can; size the kept list from it up front
+            # instead of growing it one append at a time.
+            nontrivial = _nontrivial_mask(numpy.stack([op.primitive.z for op in ops]),
+                                          numpy.stack([op.primitive.x for op in ops]))
+            keep_idx = numpy.flatnonzero(nontrivial)
+            kept = [None] * keep_idx.size
+            for slot, term_index in enumerate(keep_idx.tolist()):
+                kept[slot] = ops[term_index]
+            idcoeff = 0.0
+            for term_index in numpy.flatnonzero(~nontrivial).tolist():
+                idcoeff += ops[term_index].coeff
+            # No bound can be computed from symbolic coefficients; the caller
+            # must supply one.
+            return idcoeff, SummedOp(kept), None
+        z_stack = numpy.stack([op.primitive.z for op in ops])
+        x_stack = numpy.stack([op.primitive.x for op in ops])
+
+    if z_stack.shape[0] == 0:
+        return 0.0, SummedOp([]), 0.0
+    nontrivial = _nontrivial_mask(z_stack, x_stack)
+    # numpy's pairwise summation keeps the error growth of this coefficient,
+    # which is added back to every eigenvalue, at O(log n) rather than O(n).
+    id_coeff = numpy.sum(coeffs[~nontrivial])
+    id_coeff = id_coeff.real if id_coeff.imag == 0 else complex(id_coeff)
+    if not nontrivial.any():
+        return id_coeff, SummedOp([]), 0.0
+    bound = float(numpy.abs(coeffs[nontrivial]).sum())
+    # The kept terms are returned as a PauliSumOp, whose SparsePauliOp
+    # primitive stores the symplectic data contiguously; downstream
+    # routines then work on arrays rather than per-term PyObjects.
+    table = PauliTable(numpy.hstack([x_stack[nontrivial], z_stack[nontrivial]]))
+    return id_coeff, PauliSumOp(SparsePauliOp(table, coeffs[nontrivial])), bound
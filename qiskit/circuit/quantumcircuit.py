@@ -16,6 +16,7 @@
 
 import copy
 import itertools
+import os
 import sys
 import warnings
 import numbers
@@ -148,6 +149,12 @@ class QuantumCircuit:
     header = "OPENQASM 2.0;"
     extension_lib = "include \"qelib1.inc\";"
 
+    # Cache of circuits parsed by from_qasm_file, keyed on the absolute
+    # file path with the file's (mtime, size) recorded to detect changes.
+    # Bounded LRU: least recently loaded files are evicted first.
+    _qasm_file_cache = OrderedDict()
+    _QASM_FILE_CACHE_MAXSIZE = 32
+
     def __init__(self, *regs, name=None, global_phase=0, metadata=None):
         if any(not isinstance(reg, (list, QuantumRegister, ClassicalRegister)) for reg in regs):
             # check if inputs are integers, but also allow e.g. 2.0
@@ -1024,13 +1031,16 @@ class QuantumCircuit:
                                    " If Integers, up to 2 arguments. QuantumCircuit was called"
                                    " with %s." % (regs,))
 
+        # Collect the existing register names once instead of rebuilding the
+        # concatenated register list for every register being added.
+        existing_names = {reg.name for reg in self.qregs}
+        existing_names.update(reg.name for reg in self.cregs)
         for register in regs:
-            if (
-                    isinstance(register, Register)
-                    and any(register.name == reg.name for reg in self.qregs + self.cregs)
-            ):
-                raise CircuitError("register name \"%s\" already exists"
-                                   % register.name)
+            if isinstance(register, Register):
+                if register.name in existing_names:
+                    raise CircuitError("register name \"%s\" already exists"
+                                       % register.name)
+                existing_names.add(register.name)
 
             if isinstance(register, AncillaRegister):
                 self._ancillas.extend(register)
@@ -1818,13 +1828,31 @@ class QuantumCircuit:
     def from_qasm_file(path):
         """Take in a QASM file and generate a QuantumCircuit object.
 
+        Repeated loads of an unchanged file are served from a parse cache
+        keyed on the file path, modification time and size, so only the
+        first load pays the parsing cost.
+
         Args:
           path (str): Path to the file for a QASM program
         Return:
           QuantumCircuit: The QuantumCircuit object for the input QASM
         """
-        qasm = Qasm(filename=path)
-        return _circuit_from_qasm(qasm)
+        abspath = os.path.abspath(path)
+        stat = os.stat(abspath)
+        cache = QuantumCircuit._qasm_file_cache
+        cached = cache.get(abspath)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            cache.move_to_end(abspath)
+            circuit = cached[1]
+        else:
+            qasm = Qasm(filename=path)
+            circuit = _circuit_from_qasm(qasm)
+            cache[abspath] = ((stat.st_mtime_ns, stat.st_size), circuit)
+            if len(cache) > QuantumCircuit._QASM_FILE_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        # Deep-copy so that successive loads of the same file get independent
+        # Register and Bit objects, as if each had been parsed from scratch.
+        return copy.deepcopy(circuit)
 
     @staticmethod
     def from_qasm_str(qasm_str):
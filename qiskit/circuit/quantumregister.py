@@ -23,6 +23,8 @@ from .bit import Bit
 class Qubit(Bit):
     """Implement a quantum bit."""
 
+    __slots__ = ()
+
     def __init__(self, register=None, index=None):
         """Creates a qubit.
 
@@ -56,7 +58,8 @@ class QuantumRegister(Register):
 
 class AncillaQubit(Qubit):
     """A qubit used as ancillary qubit."""
-    pass
+
+    __slots__ = ()
 
 
 class AncillaRegister(QuantumRegister):
@@ -228,6 +228,24 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
                       " 'instruction_durations' should be usually provided.",
                       UserWarning)
 
+    if (optimization_level == 0 and backend is None and basis_gates is None
+            and coupling_map is None and backend_properties is None
+            and initial_layout is None and layout_method is None
+            and routing_method is None and translation_method is None
+            and scheduling_method is None and instruction_durations is None
+            and dt is None and callback is None):
+        # Nothing constrains the target and no optimization was requested, so
+        # the preset pass manager would leave every circuit unchanged: skip
+        # the DAG round trip and hand back copies directly.
+        output_names = _parse_output_name(output_name, circuits)
+        circuits = [circuit.copy(name=name)
+                    for circuit, name in zip(circuits, output_names)]
+        end_time = time()
+        _log_transpile_time(start_time, end_time)
+        if arg_circuits_list:
+            return circuits
+        return circuits[0]
+
     # Get transpile_args to configure the circuit transpilation job(s)
     transpile_args = _parse_transpile_args(circuits, backend, basis_gates, coupling_map,
                                            backend_properties, initial_layout,
@@ -543,10 +561,10 @@ def _parse_backend_properties(backend_properties, backend, num_circuits):
                     del backend_properties.qubits[faulty_qubit]
 
                 gates = []
+                faulty_qubits_map = _create_faulty_qubits_map(backend)
                 for gate in backend_properties.gates:
                     # remove gates using faulty edges or with faulty qubits (and remap the
                     # gates in terms of faulty_qubits_map)
-                    faulty_qubits_map = _create_faulty_qubits_map(backend)
                     if any(faulty_qubits_map[qubits] is not None for qubits in gate.qubits) or \
                             gate.qubits in faulty_edges:
                         continue
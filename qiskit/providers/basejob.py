@@ -73,7 +73,10 @@ class BaseJob(ABC):
 
         Args:
             timeout: Seconds to wait for the job. If ``None``, wait indefinitely.
-            wait: Seconds between queries.
+            wait: Maximum seconds between queries. Polling starts at a shorter
+                interval and backs off exponentially to this value, so short
+                jobs are detected promptly without hammering the backend for
+                long ones.
             callback: Callback function invoked after each query.
                 The following positional arguments are provided to the callback function:
 
@@ -90,6 +93,7 @@ class BaseJob(ABC):
         """
         start_time = time.time()
         status = self.status()
+        delay = min(0.1, wait)
         while status not in JOB_FINAL_STATES:
             elapsed_time = time.time() - start_time
             if timeout is not None and elapsed_time >= timeout:
@@ -97,7 +101,8 @@ class BaseJob(ABC):
                     'Timeout while waiting for job {}.'.format(self.job_id()))
             if callback:
                 callback(self.job_id(), status, self)
-            time.sleep(wait)
+            time.sleep(delay)
+            delay = min(delay * 2, wait)
             status = self.status()
 
     @abstractmethod
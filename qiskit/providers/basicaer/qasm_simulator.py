@@ -31,6 +31,7 @@ field, which is a result of measurements for each shot.
 import uuid
 import time
 import logging
+import multiprocessing
 
 from math import log2
 from collections import Counter
@@ -41,6 +42,7 @@ from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
@@ -48,6 +50,20 @@ from .basicaertools import einsum_vecmul_index
 
 logger = logging.getLogger(__name__)
 
+# Source of fallback simulator seeds when neither the experiment nor the qobj
+# provides one. A dedicated PCG64 generator avoids contending on (and being
+# perturbed by) the global NumPy legacy RNG. The simulator itself keeps a
+# seeded RandomState so that results for a given seed_simulator are stable
+# across releases.
+_SEED_SOURCE = np.random.default_rng()
+
+# Gate-name sets tested against on every instruction; frozensets give O(1)
+# membership checks and are allocated once at import.
+_SINGLE_QUBIT_GATES = frozenset(('U', 'u1', 'u2', 'u3'))
+_IDENTITY_GATES = frozenset(('id', 'u0'))
+_CX_GATES = frozenset(('CX', 'cx'))
+_SAMPLE_COMPATIBLE_INSTS = frozenset(('measure', 'barrier', 'id', 'u0'))
+
 
 class QasmSimulatorPy(BaseBackend):
     """Python implementation of a qasm simulator."""
@@ -179,7 +195,7 @@ class QasmSimulatorPy(BaseBackend):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            list or ndarray: The sampled memory values as integers.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -199,9 +215,21 @@ class QasmSimulatorPy(BaseBackend):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured),
+        samples = self._local_random.choice(2 ** num_measured,
                                             num_samples, p=probabilities)
-        # Convert the ints to bitstrings
+        # Map the sampled ints onto the classical memory. When the memory fits
+        # in a machine word the mapping is done with vectorized bit operations
+        # over all samples at once; otherwise fall back to per-sample Python
+        # arithmetic on unbounded ints.
+        if self._number_of_cmembits < 64:
+            base = self._classical_memory
+            for _, cmembit in measure_params:
+                base &= ~(1 << cmembit)
+            mem = np.full(num_samples, base, dtype=np.int64)
+            for qubit, cmembit in measure_params:
+                pos = measured_qubits.index(qubit)
+                mem |= ((samples >> pos) & 1) << cmembit
+            return mem
         memory = []
         for sample in samples:
             classical_memory = self._classical_memory
@@ -210,8 +238,7 @@ class QasmSimulatorPy(BaseBackend):
                 qubit_outcome = int((sample & (1 << pos)) >> pos)
                 membit = 1 << cmembit
                 classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+            memory.append(classical_memory)
         return memory
 
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
@@ -352,7 +379,7 @@ class QasmSimulatorPy(BaseBackend):
                 if measure_flag:
                     # If we find a non-measure instruction
                     # we cannot do measure sampling
-                    if instruction.name not in ["measure", "barrier", "id", "u0"]:
+                    if instruction.name not in _SAMPLE_COMPATIBLE_INSTS:
                         self._sample_measure = False
                         return
                 elif instruction.name == "measure":
@@ -404,13 +431,23 @@ class QasmSimulatorPy(BaseBackend):
             Result: Result object
         """
         self._validate(qobj)
-        result_list = []
         self._shots = qobj.config.shots
         self._memory = getattr(qobj.config, 'memory', False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        # Experiments are independent, so they can be simulated in parallel
+        # worker processes. Resolve each experiment's seed before dispatching:
+        # forked workers share the parent's global RNG state, so drawing the
+        # seeds there would correlate the experiments. The seeds stay local to
+        # this job; the caller's qobj is never modified.
+        seeds = [self._experiment_seed(experiment) for experiment in qobj.experiments]
+        # The job executor runs this method in a daemonic worker process on
+        # some platforms, and daemonic processes may not fork children of
+        # their own, so keep the dispatch serial there.
+        num_processes = 1 if multiprocessing.current_process().daemon else CPU_COUNT
+        result_list = parallel_map(self._run_experiment_with_seed,
+                                   list(zip(qobj.experiments, seeds)),
+                                   num_processes=num_processes)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -424,11 +461,30 @@ class QasmSimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
-    def run_experiment(self, experiment):
+    def _experiment_seed(self, experiment):
+        """Resolve the simulator seed for an experiment, looking in the
+        experiment config, then the qobj config, and finally drawing one."""
+        if hasattr(experiment.config, 'seed_simulator'):
+            return experiment.config.seed_simulator
+        if hasattr(self._qobj_config, 'seed_simulator'):
+            return self._qobj_config.seed_simulator
+        # For compatibility on Windows force dyte to be int32
+        # and set the maximum value to be (2 ** 31) - 1
+        return int(_SEED_SOURCE.integers(2147483647, dtype='int32'))
+
+    def _run_experiment_with_seed(self, experiment_and_seed):
+        """parallel_map adapter: unpack an (experiment, seed) pair."""
+        experiment, seed_simulator = experiment_and_seed
+        return self.run_experiment(experiment, seed_simulator)
+
+    def run_experiment(self, experiment, seed_simulator=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            seed_simulator (int): seed for the simulator RNG. If None, the
+                seed is resolved from the experiment config, then the qobj
+                config, and finally drawn at random.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -460,14 +516,8 @@ class QasmSimulatorPy(BaseBackend):
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
         # Get the seed looking in circuit, qobj, and then random.
-        if hasattr(experiment.config, 'seed_simulator'):
-            seed_simulator = experiment.config.seed_simulator
-        elif hasattr(self._qobj_config, 'seed_simulator'):
-            seed_simulator = self._qobj_config.seed_simulator
-        else:
-            # For compatibility on Windows force dyte to be int32
-            # and set the maximum value to be (2 ** 31) - 1
-            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        if seed_simulator is None:
+            seed_simulator = self._experiment_seed(experiment)
 
         self._local_random.seed(seed=seed_simulator)
         # Check if measure sampling is supported for current circuit
@@ -484,14 +534,17 @@ class QasmSimulatorPy(BaseBackend):
             measure_sample_ops = []
         else:
             shots = self._shots
+        # Hoist lookups that are invariant across shots out of the loop.
+        instructions = experiment.instructions
+        global_phase_factor = np.exp(1j * global_phase)
         for _ in range(shots):
             self._initialize_statevector()
             # apply global_phase
-            self._statevector *= np.exp(1j * global_phase)
+            self._statevector *= global_phase_factor
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
+            for operation in instructions:
                 conditional = getattr(operation, 'conditional', None)
                 if isinstance(conditional, int):
                     conditional_bit_set = (self._classical_register >> conditional) & 1
@@ -512,15 +565,15 @@ class QasmSimulatorPy(BaseBackend):
                     qubits = operation.qubits
                     gate = operation.params[0]
                     self._add_unitary(gate, qubits)
-                elif operation.name in ('U', 'u1', 'u2', 'u3'):
+                elif operation.name in _SINGLE_QUBIT_GATES:
                     params = getattr(operation, 'params', None)
                     qubit = operation.qubits[0]
                     gate = single_gate_matrix(operation.name, params)
                     self._add_unitary(gate, [qubit])
                 # Check if CX gate
-                elif operation.name in ('id', 'u0'):
+                elif operation.name in _IDENTITY_GATES:
                     pass
-                elif operation.name in ('CX', 'cx'):
+                elif operation.name in _CX_GATES:
                     qubit0 = operation.qubits[0]
                     qubit1 = operation.qubits[1]
                     gate = cx_gate_matrix()
@@ -589,15 +642,23 @@ class QasmSimulatorPy(BaseBackend):
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
-
-        # Add data
-        data = {'counts': dict(Counter(memory))}
+                    memory.append(self._classical_memory)
+
+        # Aggregate the integer outcomes, formatting each distinct memory
+        # value as hex only once rather than once per shot.
+        if isinstance(memory, np.ndarray):
+            # Sampled shots arrive as an integer array, so the histogram can
+            # be built at C speed instead of counting in Python per shot.
+            values, value_counts = np.unique(memory, return_counts=True)
+            int_counts = dict(zip(values.tolist(), value_counts.tolist()))
+            memory = memory.tolist()
+        else:
+            int_counts = Counter(memory)
+        data = {'counts': {hex(value): count for value, count in int_counts.items()}}
         # Optionally add memory list
         if self._memory:
-            data['memory'] = memory
+            hex_values = {value: hex(value) for value in int_counts}
+            data['memory'] = [hex_values[value] for value in memory]
         # Optionally add final statevector
         if self.SHOW_FINAL_STATE:
             data['statevector'] = self._get_statevector()
@@ -629,6 +690,6 @@ class QasmSimulatorPy(BaseBackend):
             if experiment.config.memory_slots == 0:
                 logger.warning('No classical registers in circuit "%s", '
                                'counts will be empty.', name)
-            elif 'measure' not in [op.name for op in experiment.instructions]:
+            elif all(op.name != 'measure' for op in experiment.instructions):
                 logger.warning('No measurements in circuit "%s", '
                                'classical register will remain all zeros.', name)
@@ -29,6 +29,7 @@ circuit's unitary matrix.
 import logging
 import uuid
 import time
+import multiprocessing
 from math import log2, sqrt
 import numpy as np
 from qiskit.utils.multiprocessing import local_hardware_info
@@ -36,6 +37,7 @@ from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
@@ -259,10 +261,15 @@ class UnitarySimulatorPy(BaseBackend):
             Result: Result object
         """
         self._validate(qobj)
-        result_list = []
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        # Experiments are independent of each other, so they can be simulated
+        # in parallel worker processes. The job executor runs this method in a
+        # daemonic worker process on some platforms, and daemonic processes
+        # may not fork children of their own, so keep the dispatch serial
+        # there.
+        num_processes = 1 if multiprocessing.current_process().daemon else CPU_COUNT
+        result_list = parallel_map(self.run_experiment, qobj.experiments,
+                                   num_processes=num_processes)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
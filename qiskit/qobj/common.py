@@ -16,16 +16,33 @@ import json
 import os
 from types import SimpleNamespace
 
-import fastjsonschema
-
-
 path_part = 'schemas/qobj_schema.json'
 path = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
     path_part)
-with open(path) as fd:
-    json_schema = json.loads(fd.read())
-validator = fastjsonschema.compile(json_schema)
+
+_compiled_validator = None
+
+
+def validator(qobj_dict):
+    """Validate a Qobj dictionary against the Qobj JSON schema.
+
+    The schema is loaded and compiled on first use rather than at import
+    time, since compiling it is expensive and validation is optional.
+
+    Args:
+        qobj_dict (dict): A dictionary representation of a Qobj.
+
+    Returns:
+        dict: The validated dictionary.
+    """
+    global _compiled_validator  # pylint: disable=global-statement
+    if _compiled_validator is None:
+        import fastjsonschema
+        with open(path) as fd:
+            json_schema = json.loads(fd.read())
+        _compiled_validator = fastjsonschema.compile(json_schema)
+    return _compiled_validator(qobj_dict)
 
 
 class QobjDictField(SimpleNamespace):
@@ -35,9 +35,8 @@ def average_data(counts, observable):
     """
     if not isinstance(observable, dict):
         observable = make_dict_observable(observable)
-    temp = 0
     tot = sum(counts.values())
-    for key in counts:
-        if key in observable:
-            temp += counts[key] * observable[key] / tot
-    return temp
+    if tot == 0:
+        return 0.0
+    return sum(counts[key] * observable[key]
+               for key in counts.keys() & observable.keys()) / tot
@@ -121,6 +121,12 @@ class BasisTranslator(TransformationPass):
         # Replace source instructions with target translations.
 
         replace_start_time = time.time()
+        # Unbound target circuits converted from instr_map, and bound target
+        # DAGs already built for a given (name, num_qubits, params) triple.
+        # Both conversions are invariant per distinct gate, so repeated
+        # instances skip the dag -> circuit -> dag round trip entirely.
+        target_circuit_cache = {}
+        bound_dag_cache = {}
         for node in dag.op_nodes():
             if node.name in target_basis:
                 continue
@@ -139,16 +145,30 @@ class BasisTranslator(TransformationPass):
                             target_params, target_dag))
 
                 if node.op.params:
-                    # Convert target to circ and back to assign_parameters, since
-                    # DAGCircuits won't have a ParameterTable.
-                    from qiskit.converters import dag_to_circuit, circuit_to_dag
-                    target_circuit = dag_to_circuit(target_dag)
-
-                    target_circuit.assign_parameters(
-                        dict(zip_longest(target_params, node.op.params)),
-                        inplace=True)
-
-                    bound_target_dag = circuit_to_dag(target_circuit)
+                    try:
+                        bound_key = (node.op.name, node.op.num_qubits, tuple(node.op.params))
+                        bound_target_dag = bound_dag_cache.get(bound_key)
+                    except TypeError:
+                        # Unhashable params (e.g. an ndarray).
+                        bound_key = None
+                        bound_target_dag = None
+                    if bound_target_dag is None:
+                        # Convert target to circ and back to assign_parameters, since
+                        # DAGCircuits won't have a ParameterTable.
+                        from qiskit.converters import dag_to_circuit, circuit_to_dag
+                        map_key = (node.op.name, node.op.num_qubits)
+                        target_circuit = target_circuit_cache.get(map_key)
+                        if target_circuit is None:
+                            target_circuit = dag_to_circuit(target_dag)
+                            target_circuit_cache[map_key] = target_circuit
+
+                        bound_circuit = target_circuit.assign_parameters(
+                            dict(zip_longest(target_params, node.op.params)),
+                            inplace=False)
+
+                        bound_target_dag = circuit_to_dag(bound_circuit)
+                        if bound_key is not None:
+                            bound_dag_cache[bound_key] = bound_target_dag
                 else:
                     bound_target_dag = target_dag
 
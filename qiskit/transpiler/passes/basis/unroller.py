@@ -14,9 +14,13 @@
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import ControlledGate
+from qiskit.circuit import ControlledGate, Gate, Instruction
 from qiskit.converters.circuit_to_dag import circuit_to_dag
 
+# Instructions the pass always passes through untouched, whether or not the
+# target basis lists them.
+_BASIC_INSTS = frozenset(('measure', 'reset', 'barrier', 'snapshot', 'delay'))
+
 
 class Unroller(TransformationPass):
     """Unroll a circuit to a given basis.
@@ -34,6 +38,33 @@ class Unroller(TransformationPass):
         """
         super().__init__()
         self.basis = basis
+        # Set view of the basis, built on first use; membership is checked
+        # once per node (and more under recursion), so a list scan adds up.
+        self._basis_set = None
+        # Memoized unrolled decompositions, keyed by the identity of the gate
+        # they expand. Repeated instances of the same gate (same class, name,
+        # width and parameters) unroll to the same DAG, so it is rebuilt only
+        # once per pass instead of once per node.
+        self._unrolled_dag_cache = {}
+
+    def _cache_key(self, node):
+        """Return a hashable cache key for an op node, or None if the node's
+        decomposition cannot be safely shared between nodes."""
+        op_class = node.op.__class__
+        if op_class in (Gate, Instruction, ControlledGate):
+            # Generic instructions with user-supplied definitions may collide
+            # on (name, params), so never share their decompositions.
+            return None
+        if node.op.condition is not None:
+            return None
+        key = (op_class, node.name, node.op.num_qubits,
+               getattr(node.op, 'ctrl_state', None), tuple(node.op.params))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameters (e.g. an ndarray).
+            return None
+        return key
 
     def run(self, dag):
         """Run the Unroller pass on `dag`.
@@ -50,19 +81,34 @@ class Unroller(TransformationPass):
         """
         if self.basis is None:
             return dag
+        basis = self._basis_set
+        if basis is None:
+            # A single gate name may be passed as a bare string; freezing it
+            # directly would turn it into a set of characters.
+            if isinstance(self.basis, str):
+                basis = self._basis_set = frozenset([self.basis])
+            else:
+                basis = self._basis_set = frozenset(self.basis)
         # Walk through the DAG and expand each non-basis node
-        basic_insts = ['measure', 'reset', 'barrier', 'snapshot', 'delay']
+        # Fast path: if every operation is already a basis gate (or a directive
+        # the device accepts), there is nothing to expand. Open-control gates
+        # keep the name of their closed-control counterpart, so they still
+        # require the full walk below.
+        if frozenset(dag.count_ops()).issubset(basis | _BASIC_INSTS):
+            if not any(isinstance(node.op, ControlledGate) and node.op._open_ctrl
+                       for node in dag.op_nodes()):
+                return dag
         for node in dag.op_nodes():
             if node.op._directive:
                 continue
 
-            if node.name in basic_insts:
+            if node.name in _BASIC_INSTS:
                 # TODO: this is legacy behavior.Basis_insts should be removed that these
                 #  instructions should be part of the device-reported basis. Currently, no
                 #  backend reports "measure", for example.
                 continue
 
-            if node.name in self.basis:  # If already a base, ignore.
+            if node.name in basis:  # If already a base, ignore.
                 if isinstance(node.op, ControlledGate) and node.op._open_ctrl:
                     pass
                 else:
@@ -79,7 +125,7 @@ class Unroller(TransformationPass):
             # to substitute_node_with_dag if an the width of the definition is
             # different that the width of the node.
             while rule and len(rule) == 1 and len(node.qargs) == len(rule[0][1]) == 1:
-                if rule[0][0].name in self.basis:
+                if rule[0][0].name in basis:
                     if node.op.definition and node.op.definition.global_phase:
                         dag.global_phase += node.op.definition.global_phase
                     dag.substitute_node(node, rule[0][0], inplace=True)
@@ -98,7 +144,13 @@ class Unroller(TransformationPass):
                     raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
                                       "No rule to expand instruction %s." %
                                       (str(self.basis), node.op.name))
-                decomposition = circuit_to_dag(node.op.definition)
-                unrolled_dag = self.run(decomposition)  # recursively unroll ops
+                cache_key = self._cache_key(node)
+                unrolled_dag = self._unrolled_dag_cache.get(cache_key) \
+                    if cache_key is not None else None
+                if unrolled_dag is None:
+                    decomposition = circuit_to_dag(node.op.definition)
+                    unrolled_dag = self.run(decomposition)  # recursively unroll ops
+                    if cache_key is not None:
+                        self._unrolled_dag_cache[cache_key] = unrolled_dag
                 dag.substitute_node_with_dag(node, unrolled_dag)
         return dag
@@ -74,8 +74,8 @@ def _combine_result_objects(results: List[Result]) -> Result:
 
     new_result = copy.deepcopy(results[0])
 
-    for idx in range(1, len(results)):
-        new_result.results.extend(results[idx].results)
+    for result in results[1:]:
+        new_result.results.extend(result.results)
 
     return new_result
 
@@ -104,9 +104,7 @@ def _split_qobj_to_qobjs(qobj: QasmQobj,
 def _maybe_split_qobj_by_gates(qobjs: List[QasmQobj], qobj: QasmQobj) -> List[QasmQobj]:
     if MAX_GATES_PER_JOB is not None:
         max_gates_per_job = int(MAX_GATES_PER_JOB)
-        total_num_gates = 0
-        for j in range(len(qobj.experiments)):
-            total_num_gates += len(qobj.experiments[j].instructions)
+        total_num_gates = sum(len(experiment.instructions) for experiment in qobj.experiments)
         # split by gates if total number of gates in a qobj exceed MAX_GATES_PER_JOB
         if total_num_gates > max_gates_per_job:
             qobj_template = QasmQobj(qobj_id=qobj.qobj_id,
@@ -115,17 +113,17 @@ def _maybe_split_qobj_by_gates(qobjs: List[QasmQobj], qobj: QasmQobj) -> List[Qa
             temp_qobj.qobj_id = str(uuid.uuid4())
             temp_qobj.experiments = []
             num_gates = 0
-            for i in range(len(qobj.experiments)):
-                num_gates += len(qobj.experiments[i].instructions)
+            for experiment in qobj.experiments:
+                num_gates += len(experiment.instructions)
                 if num_gates <= max_gates_per_job:
-                    temp_qobj.experiments.append(qobj.experiments[i])
+                    temp_qobj.experiments.append(experiment)
                 else:
                     qobjs.append(temp_qobj)
                     # Initialize for next temp_qobj
                     temp_qobj = copy.deepcopy(qobj_template)
                     temp_qobj.qobj_id = str(uuid.uuid4())
-                    temp_qobj.experiments.append(qobj.experiments[i])
-                    num_gates = len(qobj.experiments[i].instructions)
+                    temp_qobj.experiments.append(experiment)
+                    num_gates = len(experiment.instructions)
 
             qobjs.append(temp_qobj)
         else:
@@ -254,22 +252,16 @@ def run_qobj(qobj: QasmQobj,
     # split qobj if it exceeds the payload of the backend
 
     qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
-    jobs = []
-    job_ids = []
-    for qob in qobjs:
-        job, job_id = _safe_submit_qobj(qob, backend,
-                                        backend_options, noise_config, skip_qobj_validation)
-        job_ids.append(job_id)
-        jobs.append(job)
+    submissions = [_safe_submit_qobj(qob, backend,
+                                     backend_options, noise_config, skip_qobj_validation)
+                   for qob in qobjs]
 
     results = []
     if with_autorecover:
         logger.info("Backend status: %s", backend.status())
-        logger.info("There are %s jobs are submitted.", len(jobs))
-        logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
+        logger.info("There are %s jobs are submitted.", len(submissions))
+        logger.info("All job ids:\n%s", [job_id for _, job_id in submissions])
+        for idx, (job, job_id) in enumerate(submissions):
             while True:
                 logger.info("Running %s-th qobj, job id: %s", idx, job_id)
                 # try to get result if possible
@@ -322,11 +314,10 @@ def run_qobj(qobj: QasmQobj,
                 job, job_id = _safe_submit_qobj(qobj, backend,
                                                 backend_options,
                                                 noise_config, skip_qobj_validation)
-                jobs[idx] = job
-                job_ids[idx] = job_id
+                submissions[idx] = (job, job_id)
     else:
         results = []
-        for job in jobs:
+        for job, _ in submissions:
             results.append(job.result(**qjob_config))
 
     result = _combine_result_objects(results) if results else None
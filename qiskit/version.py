@@ -17,7 +17,6 @@
 from collections.abc import Mapping
 import os
 import subprocess
-import pkg_resources
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -119,6 +118,7 @@ class QiskitVersion(Mapping):
         except Exception:
             self._version_dict['qiskit-aqua'] = None
         try:
+            import pkg_resources
             self._version_dict['qiskit'] = pkg_resources.get_distribution('qiskit').version
         except Exception:
             self._version_dict['qiskit'] = None
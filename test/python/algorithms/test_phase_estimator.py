@@ -0,0 +1,374 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test phase estimation"""
+
+import unittest
+from test.python.algorithms import QiskitAlgorithmsTestCase
+import numpy as np
+import qiskit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import SGate
+from qiskit.algorithms import PhaseEstimationScale
+from qiskit.algorithms import HamiltonianPhaseEstimation
+from qiskit.algorithms.phase_estimators.hamiltonian_phase_estimation import (_remove_identity,
+                                                                             _reorder_paulis)
+from qiskit.algorithms import PhaseEstimation
+from qiskit.opflow import (H, X, Y, Z, I, StateFn, PauliTrotterEvolution,
+                           MatrixEvolution, SummedOp)
+
+
+class TestHamiltonianPhaseEstimation(QiskitAlgorithmsTestCase):
+    """Tests for obtaining eigenvalues from phase estimation"""
+
+    def hamiltonian_pe(self, hamiltonian, state_preparation=None, num_evaluation_qubits=6,
+                       backend=None, evolution=None, bound=None):
+        """Run HamiltonianPhaseEstimation and return result with all phases."""
+        if backend is None:
+            backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        quantum_instance = qiskit.utils.QuantumInstance(backend=backend, shots=10000)
+        phase_est = HamiltonianPhaseEstimation(
+            num_evaluation_qubits=num_evaluation_qubits,
+            quantum_instance=quantum_instance)
+        result = phase_est.estimate(
+            hamiltonian=hamiltonian,
+            state_preparation=state_preparation, evolution=evolution,
+            bound=bound)
+        return result
+
+    # pylint: disable=invalid-name
+    def test_pauli_sum_1(self):
+        """Two eigenvalues from Pauli sum with X, Z"""
+        hamiltonian = 0.5 * X + Z
+        state_preparation = StateFn(H.to_circuit())
+        evo = PauliTrotterEvolution(trotter_mode='suzuki', reps=4)
+        result = self.hamiltonian_pe(hamiltonian, state_preparation, evolution=evo)
+        phase_dict = result.filter_phases(0.162, as_float=True)
+        phases = list(phase_dict.keys())
+        phases.sort()
+        self.assertAlmostEqual(phases[0], -1.125, delta=0.001)
+        self.assertAlmostEqual(phases[1], 1.125, delta=0.001)
+
+    def test_pauli_sum_2(self):
+        """Two eigenvalues from Pauli sum with X, Y, Z"""
+        hamiltonian = 0.5 * X + Y + Z
+        state_preparation = None
+        evo = PauliTrotterEvolution(trotter_mode='suzuki', reps=4)
+        result = self.hamiltonian_pe(hamiltonian, state_preparation, evolution=evo)
+        phase_dict = result.filter_phases(0.1, as_float=True)
+        phases = list(phase_dict.keys())
+        phases.sort()
+        self.assertAlmostEqual(phases[0], -1.484, delta=0.001)
+        self.assertAlmostEqual(phases[1], 1.484, delta=0.001)
+
+    def test_single_pauli_op(self):
+        """Two eigenvalues from Pauli sum with X, Y, Z"""
+        hamiltonian = Z
+        state_preparation = None
+        result = self.hamiltonian_pe(hamiltonian, state_preparation)
+        eigv = result.most_likely_eigenvalue
+        with self.subTest('First eigenvalue'):
+            self.assertAlmostEqual(eigv, 1.0, delta=0.001)
+
+        state_preparation = StateFn(X.to_circuit())
+        result = self.hamiltonian_pe(hamiltonian, state_preparation, bound=1.05)
+        eigv = result.most_likely_eigenvalue
+        with self.subTest('Second eigenvalue'):
+            self.assertAlmostEqual(eigv, -0.98, delta=0.01)
+
+    def test_H2_hamiltonian(self):
+        """Test H2 hamiltonian"""
+        hamiltonian = ((-1.0523732457728587 * (I ^ I)) + (0.3979374248431802 * (I ^ Z))
+                       + (-0.3979374248431802 * (Z ^ I)) + (-0.011280104256235324 * (Z ^ Z))
+                       + (0.18093119978423147 * (X ^ X)))
+        state_preparation = StateFn((I ^ H).to_circuit())
+        evo = PauliTrotterEvolution(trotter_mode='suzuki', reps=4)
+        result = self.hamiltonian_pe(hamiltonian, state_preparation, evolution=evo)
+        with self.subTest('Most likely eigenvalues'):
+            self.assertAlmostEqual(result.most_likely_eigenvalue, -1.855, delta=.001)
+        with self.subTest('Most likely phase'):
+            self.assertAlmostEqual(result.most_likely_phase, 0.5937, delta=.001)
+        with self.subTest('All eigenvalues'):
+            phase_dict = result.filter_phases(0.1)
+            phases = list(phase_dict.keys())
+            phases.sort()
+            self.assertAlmostEqual(phases[0], -1.8551, delta=.001)
+            self.assertAlmostEqual(phases[1], -1.2376, delta=.001)
+            self.assertAlmostEqual(phases[2], -0.8979, delta=.001)
+
+    def test_matrix_evolution(self):
+        """1Q Hamiltonian with MatrixEvolution"""
+        hamiltonian = ((0.5 * X) + (0.6 * Y) + (0.7 * I))
+        state_preparation = None
+        result = self.hamiltonian_pe(hamiltonian, state_preparation,
+                                     evolution=MatrixEvolution())
+        phase_dict = result.filter_phases(0.2, as_float=True)
+        phases = list(phase_dict.keys())
+        self.assertAlmostEqual(phases[0], 1.490, delta=0.001)
+        self.assertAlmostEqual(phases[1], -0.090, delta=0.001)
+
+    def _setup_from_bound(self, evolution, op_class):
+        hamiltonian = 0.5 * X + Y + Z
+        state_preparation = None
+        bound = 1.2 * sum([abs(hamiltonian.coeff * coeff)
+                           for coeff in hamiltonian.primitive.coeffs])
+        if op_class == 'SummedOp':
+            hamiltonian = hamiltonian.to_pauli_op()
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend, shots=10000)
+        phase_est = HamiltonianPhaseEstimation(num_evaluation_qubits=6,
+                                               quantum_instance=qi)
+        result = phase_est.estimate(hamiltonian=hamiltonian,
+                                    bound=bound,
+                                    evolution=evolution,
+                                    state_preparation=state_preparation)
+        return result
+
+    def test_from_bound(self):
+        """HamiltonianPhaseEstimation with bound"""
+        for op_class in ('SummedOp', 'PauliSumOp'):
+            result = self._setup_from_bound(MatrixEvolution(), op_class)
+            cutoff = 0.01
+            phases = result.filter_phases(cutoff)
+            with self.subTest('test phases has the correct length: {}'.format(op_class)):
+                self.assertEqual(len(phases), 2)
+            with self.subTest('test scaled phases are correct: {}'.format(op_class)):
+                self.assertEqual(list(phases.keys()), [1.5, -1.5])
+            phases = result.filter_phases(cutoff, scaled=False)
+            with self.subTest('test unscaled phases are correct: {}'.format(op_class)):
+                self.assertEqual(list(phases.keys()), [0.25, 0.75])
+
+    def test_trotter_from_bound(self):
+        """HamiltonianPhaseEstimation with bound and Trotterization"""
+        result = self._setup_from_bound(PauliTrotterEvolution(trotter_mode='suzuki', reps=3),
+                                        'PauliSumOp')
+        phase_dict = result.filter_phases(0.1)
+        phases = list(phase_dict.keys())
+        with self.subTest('test phases has the correct length'):
+            self.assertEqual(len(phases), 2)
+        with self.subTest('test phases has correct values'):
+            self.assertAlmostEqual(phases[0], 1.5, delta=0.001)
+            self.assertAlmostEqual(phases[1], -1.5, delta=0.001)
+
+    def test_unitary_cache(self):
+        """Repeated estimates with the same Hamiltonian reuse the cached unitary"""
+        hamiltonian = (0.5 * X + Z).to_pauli_op()
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend)
+        phase_est = HamiltonianPhaseEstimation(num_evaluation_qubits=4,
+                                               quantum_instance=qi)
+        result1 = phase_est.estimate(hamiltonian=hamiltonian)
+        self.assertEqual(len(phase_est._unitary_cache), 1)
+        result2 = phase_est.estimate(hamiltonian=hamiltonian)
+        self.assertEqual(len(phase_est._unitary_cache), 1)
+        self.assertEqual(result1.most_likely_eigenvalue, result2.most_likely_eigenvalue)
+
+    def test_result_cache(self):
+        """Repeated estimates with unchanged circuits reuse the backend result"""
+        hamiltonian = (0.5 * X + Z).to_pauli_op()
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend)
+        phase_est = HamiltonianPhaseEstimation(num_evaluation_qubits=4,
+                                               quantum_instance=qi)
+        result1 = phase_est.estimate(hamiltonian=hamiltonian)
+        result2 = phase_est.estimate(hamiltonian=hamiltonian)
+        self.assertEqual(len(phase_est._pe_cache), 1)
+        self.assertIs(result1._phase_estimation_result, result2._phase_estimation_result)
+
+    def test_estimate_many(self):
+        """Batched estimates agree with individual estimates"""
+        hamiltonian = (0.5 * X + Y + Z).to_pauli_op()
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend)
+        phase_est = HamiltonianPhaseEstimation(num_evaluation_qubits=6,
+                                               quantum_instance=qi)
+        bounds = [3.0, 4.0]
+        results = phase_est.estimate_many(hamiltonian=hamiltonian, bounds=bounds)
+        self.assertEqual(len(results), 2)
+        for result, bound in zip(results, bounds):
+            expected = phase_est.estimate(hamiltonian=hamiltonian, bound=bound)
+            self.assertEqual(result.most_likely_eigenvalue,
+                             expected.most_likely_eigenvalue)
+
+    def test_all_identity(self):
+        """Pure-identity Hamiltonians are answered without running the backend"""
+        hamiltonian = SummedOp([0.25 * (I ^ I), 0.5 * (I ^ I)])
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend)
+        phase_est = HamiltonianPhaseEstimation(num_evaluation_qubits=4,
+                                               quantum_instance=qi)
+        result = phase_est.estimate(hamiltonian=hamiltonian)
+        self.assertAlmostEqual(result.most_likely_eigenvalue, 0.75)
+        self.assertEqual(result.filter_phases(), {0.75: 1.0})
+
+    def test_remove_identity_parameterized(self):
+        """Identity filtering copes with unbound parameter coefficients"""
+        alpha = Parameter('alpha')
+        hamiltonian = SummedOp([alpha * (Z ^ Z), 0.5 * (I ^ I)])
+        id_coefficient, hamiltonian_no_id, bound = _remove_identity(hamiltonian)
+        self.assertEqual(id_coefficient, 0.5)
+        self.assertEqual(len(hamiltonian_no_id), 1)
+        self.assertIsNone(bound)
+
+    def test_reorder_paulis(self):
+        """Commuting-term reordering preserves the terms of the sum"""
+        hamiltonian = SummedOp([(X ^ X), (Z ^ I), (Z ^ Z), (X ^ I)])
+        reordered = _reorder_paulis(hamiltonian)
+        self.assertEqual(len(reordered), len(hamiltonian))
+        self.assertCountEqual([str(op) for op in reordered],
+                              [str(op) for op in hamiltonian])
+
+
+class TestPhaseEstimation(QiskitAlgorithmsTestCase):
+    """Evolution tests."""
+
+    # pylint: disable=invalid-name
+    def one_phase(self, unitary_circuit, state_preparation=None, n_eval_qubits=6,
+                  backend=None):
+        """Run phase estimation with operator, eigenvalue pair `unitary_circuit`,
+        `state_preparation`. Return the bit string with the largest amplitude.
+        """
+        if backend is None:
+            backend = qiskit.BasicAer.get_backend('qasm_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend, shots=10000)
+        p_est = PhaseEstimation(num_evaluation_qubits=n_eval_qubits,
+                                quantum_instance=qi)
+        result = p_est.estimate(unitary=unitary_circuit,
+                                state_preparation=state_preparation)
+        phase = result.most_likely_phase
+        return phase
+
+    def test_qpe_Z0(self):
+        """eigenproblem Z, |0>"""
+        unitary_circuit = Z.to_circuit()
+        state_preparation = None  # prepare |0>
+        phase = self.one_phase(unitary_circuit, state_preparation)
+        self.assertEqual(phase, 0.0)
+
+    def test_qpe_Z0_statevector(self):
+        """eigenproblem Z, |0>, statevector simulator"""
+        unitary_circuit = Z.to_circuit()
+        state_preparation = None  # prepare |0>
+        phase = self.one_phase(unitary_circuit, state_preparation,
+                               backend=qiskit.BasicAer.get_backend('statevector_simulator'))
+        self.assertEqual(phase, 0.0)
+
+    def test_qpe_Z1(self):
+        """eigenproblem Z, |1>"""
+        unitary_circuit = Z.to_circuit()
+        state_preparation = X.to_circuit()  # prepare |1>
+        phase = self.one_phase(unitary_circuit, state_preparation)
+        self.assertEqual(phase, 0.5)
+
+    def test_qpe_Xplus(self):
+        """eigenproblem X, |+>"""
+        unitary_circuit = X.to_circuit()
+        state_preparation = H.to_circuit()  # prepare |+>
+        phase = self.one_phase(unitary_circuit, state_preparation)
+        self.assertEqual(phase, 0.0)
+
+    def test_qpe_Xminus(self):
+        """eigenproblem X, |->"""
+        unitary_circuit = X.to_circuit()
+        state_preparation = X.to_circuit()
+        state_preparation.append(H.to_circuit(), [0])  # prepare |->
+        phase = self.one_phase(unitary_circuit, state_preparation)
+        self.assertEqual(phase, 0.5)
+
+    def phase_estimation(self, unitary_circuit, state_preparation=None, num_evaluation_qubits=6,
+                         backend=None):
+        """Run phase estimation with operator, eigenvalue pair `unitary_circuit`,
+        `state_preparation`. Return all results
+        """
+        if backend is None:
+            backend = qiskit.BasicAer.get_backend('qasm_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend, shots=10000)
+        phase_est = PhaseEstimation(num_evaluation_qubits=num_evaluation_qubits,
+                                    quantum_instance=qi)
+        result = phase_est.estimate(unitary=unitary_circuit,
+                                    state_preparation=state_preparation)
+        return result
+
+    def test_qpe_Zplus(self):
+        """superposition eigenproblem Z, |+>"""
+        unitary_circuit = Z.to_circuit()
+        state_preparation = H.to_circuit()  # prepare |+>
+        result = self.phase_estimation(
+            unitary_circuit, state_preparation,
+            backend=qiskit.BasicAer.get_backend('statevector_simulator'))
+        phases = result.filter_phases(1e-15, as_float=True)
+        with self.subTest('test phases has correct values'):
+            self.assertEqual(list(phases.keys()), [0.0, 0.5])
+        with self.subTest('test phases has correct probabilities'):
+            np.testing.assert_allclose(list(phases.values()), [0.5, 0.5])
+
+    def test_qpe_Zplus_strings(self):
+        """superposition eigenproblem Z, |+>, bitstrings"""
+        unitary_circuit = Z.to_circuit()
+        state_preparation = H.to_circuit()  # prepare |+>
+        result = self.phase_estimation(
+            unitary_circuit, state_preparation,
+            backend=qiskit.BasicAer.get_backend('statevector_simulator'))
+        phases = result.filter_phases(1e-15, as_float=False)
+        self.assertEqual(list(phases.keys()), ['000000', '100000'])
+
+    def test_state_preparation_sgate(self):
+        """eigenproblem S, |1>"""
+        unitary_circuit = qiskit.QuantumCircuit(1)
+        unitary_circuit.append(SGate(), [0])
+        state_preparation = X.to_circuit()  # prepare |1>
+        phase = self.one_phase(unitary_circuit, state_preparation,
+                               backend=qiskit.BasicAer.get_backend('statevector_simulator'))
+        self.assertEqual(phase, 0.25)
+
+    def test_check_num_qubits_mismatch(self):
+        """Test passing both unitary and pe_circuit raises"""
+        unitary_circuit = Z.to_circuit()
+        backend = qiskit.BasicAer.get_backend('statevector_simulator')
+        qi = qiskit.utils.QuantumInstance(backend=backend)
+        phase_est = PhaseEstimation(num_evaluation_qubits=2, quantum_instance=qi)
+        pe_circuit = phase_est.construct_circuit(unitary_circuit)
+        with self.assertRaises(ValueError):
+            phase_est.estimate(unitary=unitary_circuit, pe_circuit=pe_circuit)
+
+
+class TestPhaseEstimationScale(QiskitAlgorithmsTestCase):
+    """Tests for PhaseEstimationScale"""
+
+    def test_scale_from_pauli_sum(self):
+        """Compute bound as sum of abs values of coefficients"""
+        pauli_sum = SummedOp([(0.5 * X), (-1.0 * Z)])
+        scale = PhaseEstimationScale.from_pauli_sum(pauli_sum)
+        self.assertEqual(scale.scale, np.pi / 1.5)
+
+    def test_scale_phase(self):
+        """Phases above one half are interpreted as negative eigenvalues"""
+        scale = PhaseEstimationScale(2.0)
+        self.assertEqual(scale.scale_phase(0.25), 1.0)
+        self.assertEqual(scale.scale_phase(0.75), -1.0)
+        self.assertEqual(scale.scale_phase(0.25, id_coefficient=1.0), 2.0)
+
+    def test_scale_phases(self):
+        """Scaling a list and a dict of phases"""
+        scale = PhaseEstimationScale(2.0)
+        self.assertEqual(scale.scale_phases([0.25, 0.75]), [1.0, -1.0])
+        self.assertEqual(scale.scale_phases({0.25: 0.5, 0.75: 0.5}), {1.0: 0.5, -1.0: 0.5})
+
+    def test_from_pauli_sum_requires_paulis(self):
+        """from_pauli_sum raises unless all terms are Pauli operators"""
+        op = SummedOp([(0.5 * X @ X), ((X ^ X) + (Z ^ Z)).to_matrix_op()])
+        with self.assertRaises(ValueError):
+            PhaseEstimationScale.from_pauli_sum(op)
+
+
+if __name__ == '__main__':
+    unittest.main()
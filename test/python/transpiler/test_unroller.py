@@ -14,9 +14,11 @@
 
 """Test the Unroller pass"""
 
+import numpy
 from numpy import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.extensions import UnitaryGate
 from qiskit.extensions.simulator import Snapshot
 from qiskit.transpiler.passes import Unroller
 from qiskit.converters import circuit_to_dag, dag_to_circuit
@@ -284,6 +286,16 @@ class TestUnroller(QiskitTestCase):
 
         self.assertEqual(Operator(qc), Operator(qcd))
 
+    def test_unroll_unhashable_params(self):
+        """Test unrolling a gate whose params contain an ndarray."""
+        qc = QuantumCircuit(2)
+        qc.append(UnitaryGate(numpy.eye(4)), [0, 1])
+        dag = circuit_to_dag(qc)
+        out_dag = Unroller(['u1', 'u2', 'u3', 'cx']).run(dag)
+        qcd = dag_to_circuit(out_dag)
+
+        self.assertEqual(Operator(qc), Operator(qcd))
+
 
 class TestUnrollAllInstructions(QiskitTestCase):
     """Test unrolling a circuit containing all standard instructions."""